@@ -4,17 +4,142 @@ SVG-to-JUCE Code Converter
 Parses SR.svg and generates JUCE C++ code snippets for PluginEditor layout.
 """
 
-import xml.etree.ElementTree as ET
 import json
 import os
 import sys
 import argparse
+import functools
+import io
+import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, TextIO
+
+# Prefer lxml (C-accelerated parse/iteration), fall back to the standard library
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Optional NumPy for vectorized geometry checks
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Optional orjson for faster mapping load/save
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _json_loads = json.loads
+
+# Clark-notation tag/attribute names used in the parse hot loop
+_SVG = 'http://www.w3.org/2000/svg'
+_INKSCAPE = 'http://www.inkscape.org/namespaces/inkscape'
+_TAG_CIRCLE = f'{{{_SVG}}}circle'
+_TAG_RECT = f'{{{_SVG}}}rect'
+_TAG_G = f'{{{_SVG}}}g'
+_ATTR_INKSCAPE_LABEL = f'{{{_INKSCAPE}}}label'
+
+# Bytes fed to the XML parser per read
+_PARSE_CHUNK_SIZE = 64 * 1024
+
+# Decorative element prefixes/ids that are never UI components
+_SKIP_CIRCLE_PREFIXES = ('grain_particle', 'midi_dot', 'kbd_key')
+_SKIP_RECT_IDS = frozenset({'panel_background', 'header_bg', 'waveform_path'})
+
+# Mapped types that are not emitted as layout components
+_SKIP_TYPES = frozenset({'ModButton', 'Indicator', 'Unknown'})
+
+# Component type detection from SVG IDs, one alternative per JUCE type in
+# priority order; the matching group name is the detected type
+_TYPE_RE = re.compile(r'''
+    (?P<OccultKnob>knob_)
+  | (?P<TextButton>.*_btn\Z)
+  | (?P<ModButton>mod_)
+  | (?=.*(?:visualizer|display))
+    (?: (?=.*waveform)(?P<WaveformDisplay>)
+      | (?=.*grain)(?P<GrainVisualizer>)
+      | (?=.*lfo)(?P<LFOVisualizer>) )
+  | (?=.*(?:waveform_box|dropdown))(?P<ComboBox>)
+  | (?=.*indicator)(?P<Indicator>)
+''', re.VERBOSE | re.DOTALL)
+
+# Common SVG IDs and their parameter IDs
+_PARAM_MAP = {
+    'knob_position': 'ParamIDs::position',
+    'knob_size': 'ParamIDs::grainSize',
+    'knob_density': 'ParamIDs::density',
+    'knob_pitch': 'ParamIDs::pitch',
+    'knob_spray': 'ParamIDs::spray',
+    'knob_pan': 'ParamIDs::panSpread',
+    'knob_gatk': 'ParamIDs::grainAttack',
+    'knob_grel': 'ParamIDs::grainRelease',
+    'knob_attack': 'ParamIDs::voiceAttack',
+    'knob_decay': 'ParamIDs::voiceDecay',
+    'knob_sustain': 'ParamIDs::voiceSustain',
+    'knob_release': 'ParamIDs::voiceRelease',
+    'knob_lfo_rate': 'ParamIDs::lfoRate',
+    'knob_lfo_amount': 'ParamIDs::lfoAmount',
+    'lfo_waveform_box': 'ParamIDs::lfoWaveform',
+    'knob_delay': 'ParamIDs::delayTime',
+    'knob_flutter': 'ParamIDs::flutter',
+    'knob_hiss': 'ParamIDs::tapeHiss',
+    'knob_damage': 'ParamIDs::damage',
+    'knob_life': 'ParamIDs::life',
+    'knob_reverb': 'ParamIDs::reverb',
+    'knob_feedback': 'ParamIDs::feedback',
+    'knob_mix': 'ParamIDs::mix',
+    'knob_output': 'ParamIDs::output',
+    'sample_gain_knob': 'ParamIDs::sampleGain',
+}
+
+# Header member declaration per emitted component type: (member, label) -> line.
+# Types without an entry (ModButton, Indicator, Unknown) are not emitted.
+_HEADER_EMITTERS = {
+    'OccultKnob': lambda m, l: f'OccultKnob {m}{{"{l}"}};\n',
+    'TextButton': lambda m, l: f'juce::TextButton {m}{{"{l}"}};\n',
+    'ComboBox': lambda m, l: f'juce::ComboBox {m};\n',
+    'WaveformDisplay': lambda m, l: f'WaveformDisplay {m};\n',
+    'GrainVisualizer': lambda m, l: f'GrainVisualizer {m};\n',
+    'LFOVisualizer': lambda m, l: f'LFOVisualizer {m};\n',
+}
+
+# resized() setBounds templates; knobs (circles) are centered on their SVG position
+_CIRCLE_TMPL = """\
+{m}.setBounds(
+    static_cast<int>({x} * scaleX) - knobWidth/2,  // SVG: {xmm:.1f}mm
+    static_cast<int>({y} * scaleY) - knobHeight/2, // SVG: {ymm:.1f}mm
+    knobWidth,
+    knobHeight
+);
+"""
+
+_RECT_TMPL = """\
+{m}.setBounds(
+    static_cast<int>({x} * scaleX),  // SVG: {xmm:.1f}mm
+    static_cast<int>({y} * scaleY),  // SVG: {ymm:.1f}mm
+    static_cast<int>({w} * scaleX),
+    static_cast<int>({h} * scaleY)
+);
+"""
 
 
 class SVGComponent:
     """Represents a UI component extracted from SVG"""
+    __slots__ = ('id', 'type', 'x', 'y', 'width', 'height', 'radius', 'label', 'section')
+
     def __init__(self, element_id: str, element_type: str, x: float, y: float,
                  width: float = 0, height: float = 0, radius: float = 0,
                  label: str = "", section: str = ""):
@@ -37,43 +162,50 @@ class SVGParser:
 
     # SVG namespace
     SVG_NS = {
-        'svg': 'http://www.w3.org/2000/svg',
-        'inkscape': 'http://www.inkscape.org/namespaces/inkscape',
+        'svg': _SVG,
+        'inkscape': _INKSCAPE,
     }
 
     def __init__(self, svg_path: str):
         self.svg_path = svg_path
-        self.tree = ET.parse(svg_path)
-        self.root = self.tree.getroot()
         self.components: List[SVGComponent] = []
 
-    def parse(self) -> List[SVGComponent]:
-        """Parse SVG and extract all UI components"""
-        self.components = []
+        # Parse cache, invalidated when the SVG's mtime changes
+        self._svg_mtime: Optional[int] = None
+        self._cached: Optional[List[SVGComponent]] = None
 
-        # Find all circles (knobs)
-        for circle in self.root.iter('{http://www.w3.org/2000/svg}circle'):
-            comp = self._parse_circle(circle)
-            if comp:
-                self.components.append(comp)
+    def parse(self) -> List[SVGComponent]:
+        """Parse SVG and extract all UI components (cached until the file changes)"""
+        svg_mtime = os.stat(self.svg_path).st_mtime_ns
+        if self._cached is not None and svg_mtime == self._svg_mtime:
+            self.components = self._cached
+            return self.components
+
+        self.components = self._parse_components()
+        self._svg_mtime = svg_mtime
+        self._cached = self.components
+        return self.components
 
-        # Find all rectangles (buttons, displays)
-        for rect in self.root.iter('{http://www.w3.org/2000/svg}rect'):
-            comp = self._parse_rect(rect)
-            if comp:
-                self.components.append(comp)
+    def _parse_components(self) -> List[SVGComponent]:
+        """Extract all UI components in a single streaming pass, without building a DOM"""
+        target = SVGComponentTarget(self)
+        if HAS_LXML:
+            xml_parser = ET.XMLParser(target=target, huge_tree=True, collect_ids=False)
+        else:
+            xml_parser = ET.XMLParser(target=target)
 
-        # Find section information from groups
-        self._assign_sections()
+        with open(self.svg_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_PARSE_CHUNK_SIZE), b''):
+                xml_parser.feed(chunk)
 
-        return self.components
+        return xml_parser.close()
 
-    def _parse_circle(self, element: ET.Element) -> Optional[SVGComponent]:
+    def _parse_circle(self, element: Dict[str, str]) -> Optional[SVGComponent]:
         """Parse a circle element (typically a knob)"""
         element_id = element.get('id', '')
 
         # Skip decorative elements
-        if not element_id or element_id.startswith(('grain_particle', 'midi_dot', 'kbd_key')):
+        if not element_id or element_id.startswith(_SKIP_CIRCLE_PREFIXES):
             return None
 
         cx = float(element.get('cx', 0))
@@ -82,13 +214,12 @@ class SVGParser:
 
         return SVGComponent(element_id, 'circle', cx, cy, radius=r)
 
-    def _parse_rect(self, element: ET.Element) -> Optional[SVGComponent]:
+    def _parse_rect(self, element: Dict[str, str]) -> Optional[SVGComponent]:
         """Parse a rectangle element (buttons, displays, borders)"""
         element_id = element.get('id', '')
 
         # Skip background, borders, and decorative elements
-        skip_ids = ['panel_background', 'header_bg', 'waveform_path']
-        if not element_id or element_id.endswith('_border') or element_id in skip_ids:
+        if not element_id or element_id in _SKIP_RECT_IDS or element_id.endswith('_border'):
             return None
 
         x = float(element.get('x', 0))
@@ -98,23 +229,46 @@ class SVGParser:
 
         return SVGComponent(element_id, 'rect', x, y, width, height)
 
-    def _assign_sections(self):
-        """Assign section names to components based on SVG groups"""
-        # Find all group elements with inkscape:label
-        for group in self.root.iter('{http://www.w3.org/2000/svg}g'):
-            section_label = group.get('{http://www.inkscape.org/namespaces/inkscape}label', '')
-            group_id = group.get('id', '')
 
-            if not section_label:
-                continue
+class SVGComponentTarget:
+    """XML parser target that keeps only circles, rects and group sections"""
 
-            # Get all elements within this group
-            for comp in self.components:
-                # Check if component is in this group by checking parent hierarchy
-                for elem in group.iter():
-                    if elem.get('id') == comp.id:
-                        comp.section = section_label
-                        break
+    def __init__(self, svg_parser: SVGParser):
+        self.svg_parser = svg_parser
+        self.circles: List[SVGComponent] = []
+        self.rects: List[SVGComponent] = []
+
+        # Innermost inkscape:label of each open group (inherited when unlabeled)
+        self._section_stack: List[str] = []
+
+    def start(self, tag: str, attrib: Dict[str, str]):
+        """Handle an opening tag; everything but circles, rects and groups is ignored"""
+        if tag == _TAG_CIRCLE:
+            # Circles (knobs)
+            comp = self.svg_parser._parse_circle(attrib)
+            if comp:
+                comp.section = self._section_stack[-1] if self._section_stack else ''
+                self.circles.append(comp)
+        elif tag == _TAG_RECT:
+            # Rectangles (buttons, displays)
+            comp = self.svg_parser._parse_rect(attrib)
+            if comp:
+                comp.section = self._section_stack[-1] if self._section_stack else ''
+                self.rects.append(comp)
+        elif tag == _TAG_G:
+            section_label = attrib.get(_ATTR_INKSCAPE_LABEL, '')
+            self._section_stack.append(
+                section_label or (self._section_stack[-1] if self._section_stack else ''))
+
+    def end(self, tag: str):
+        """Handle a closing tag"""
+        if tag == _TAG_G:
+            self._section_stack.pop()
+
+    def close(self) -> List[SVGComponent]:
+        """Return the extracted components once parsing is finished"""
+        # Keep the established ordering: all circles, then all rects
+        return self.circles + self.rects
 
 
 class ComponentMapper:
@@ -127,11 +281,14 @@ class ComponentMapper:
 
     def load(self):
         """Load mapping configuration from JSON file"""
-        if os.path.exists(self.mapping_file):
-            with open(self.mapping_file, 'r') as f:
-                data = json.load(f)
-                self.config = data.get('config', {})
-                self.mapping = data.get('components', {})
+        try:
+            raw = Path(self.mapping_file).read_bytes()
+        except FileNotFoundError:
+            return
+
+        data = _json_loads(raw)
+        self.config = data.get('config', {})
+        self.mapping = data.get('components', {})
 
     def save(self):
         """Save mapping configuration to JSON file"""
@@ -139,8 +296,7 @@ class ComponentMapper:
             'config': self.config,
             'components': self.mapping
         }
-        with open(self.mapping_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(self.mapping_file).write_bytes(_json_dumps(data))
 
     def get_component_info(self, svg_id: str) -> Optional[Dict]:
         """Get JUCE component info for a given SVG ID"""
@@ -148,38 +304,14 @@ class ComponentMapper:
 
     def detect_component_type(self, component: SVGComponent) -> str:
         """Detect JUCE component type from SVG component"""
-        svg_id = component.id
-
-        # Check if it's a knob
-        if svg_id.startswith('knob_'):
-            return 'OccultKnob'
-
-        # Check if it's a button
-        if svg_id.endswith('_btn'):
-            return 'TextButton'
-
-        # Check if it's a modulation button
-        if svg_id.startswith('mod_'):
-            return 'ModButton'
-
-        # Check for specific component types
-        if 'visualizer' in svg_id or 'display' in svg_id:
-            if 'waveform' in svg_id:
-                return 'WaveformDisplay'
-            elif 'grain' in svg_id:
-                return 'GrainVisualizer'
-            elif 'lfo' in svg_id:
-                return 'LFOVisualizer'
-
-        # Check for combo box
-        if 'waveform_box' in svg_id or 'dropdown' in svg_id:
-            return 'ComboBox'
+        return self._detect_type_for_id(component.id)
 
-        # Check for indicators
-        if 'indicator' in svg_id:
-            return 'Indicator'
-
-        return 'Unknown'
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _detect_type_for_id(svg_id: str) -> str:
+        """Detect JUCE component type from an SVG ID (cached per ID)"""
+        match = _TYPE_RE.match(svg_id)
+        return match.lastgroup if match else 'Unknown'
 
 
 class CoordinateConverter:
@@ -207,6 +339,17 @@ class CoordinateConverter:
         height_px = int(round(height_mm * self.scale_y))
         return width_px, height_px
 
+    def bounds_to_juce(self, components: List[SVGComponent]) -> List[Tuple[int, int, int, int]]:
+        """Convert (x, y, width, height) of many components to JUCE pixels at once"""
+        if HAS_NUMPY:
+            mm = np.array([(c.x, c.y, c.width, c.height) for c in components],
+                          dtype=np.float64).reshape(-1, 4)
+            scale = np.array([self.scale_x, self.scale_y, self.scale_x, self.scale_y])
+            return [tuple(row) for row in np.rint(mm * scale).astype(np.int64).tolist()]
+
+        return [self.to_juce(c.x, c.y) + self.size_to_juce(c.width, c.height)
+                for c in components]
+
 
 class CodeGenerator:
     """Generates JUCE C++ code snippets from SVG components"""
@@ -217,165 +360,115 @@ class CodeGenerator:
         self.mapper = mapper
         self.converter = converter
 
-    def generate_header_snippet(self) -> str:
-        """Generate header file member declarations"""
-        lines = [
-            "// AUTO-GENERATED from SR.svg - Review before integrating",
-            "// Member variable declarations",
-            ""
-        ]
-
-        # Group components by section
-        sections = {}
-        for comp in self.components:
-            section = comp.section or "Other"
-            if section not in sections:
-                sections[section] = []
-            sections[section].append(comp)
-
-        # Generate declarations by section
-        for section, comps in sorted(sections.items()):
-            if section in ['Panel', 'Decorations', 'Header']:
-                continue  # Skip non-control sections
-
-            lines.append(f"// {section}")
-
-            for comp in comps:
-                info = self.mapper.get_component_info(comp.id)
-                if not info:
-                    lines.append(f"// UNMAPPED: {comp.id}")
-                    continue
-
-                comp_type = info.get('type', 'Unknown')
-                member_name = info.get('member', comp.id)
-                label = info.get('label', '')
-
-                # Skip modulation buttons and indicators (handled separately)
-                if comp_type in ['ModButton', 'Indicator', 'Unknown']:
-                    continue
-
-                if comp_type == 'OccultKnob':
-                    lines.append(f'OccultKnob {member_name}{{"{label}"}};')
-                elif comp_type == 'TextButton':
-                    lines.append(f'juce::TextButton {member_name}{{"{label}"}};')
-                elif comp_type == 'ComboBox':
-                    lines.append(f'juce::ComboBox {member_name};')
-                elif comp_type in ['WaveformDisplay', 'GrainVisualizer', 'LFOVisualizer']:
-                    lines.append(f'{comp_type} {member_name};')
+        # Group components by section once, alongside their precomputed
+        # JUCE pixel bounds; shared by all snippet generators
+        self._by_section: Dict[str, List[Tuple[SVGComponent, Tuple[int, int, int, int]]]] = defaultdict(list)
+        for comp, bounds in zip(components, converter.bounds_to_juce(components)):
+            self._by_section[comp.section or "Other"].append((comp, bounds))
+        self._sorted_sections = sorted(self._by_section.items())
 
-            lines.append("")
+        # Resolve mapping info once per component
+        self._info: Dict[str, Optional[Dict]] = {
+            comp.id: mapper.get_component_info(comp.id) for comp in components
+        }
 
-        return '\n'.join(lines)
+    def generate_header_snippet(self) -> str:
+        """Generate header file member declarations"""
+        return self.generate_snippets()[0]
 
     def generate_constructor_snippet(self) -> str:
         """Generate constructor initialization code"""
-        lines = [
-            "// AUTO-GENERATED from SR.svg - Review before integrating",
-            "// Constructor initialization",
-            ""
-        ]
-
-        # Setup knobs
-        lines.append("// Setup knobs with parameter attachments")
-        for comp in self.components:
-            info = self.mapper.get_component_info(comp.id)
-            if not info or info.get('type') != 'OccultKnob':
-                continue
+        return self.generate_snippets()[1]
 
-            member_name = info.get('member', '')
-            param_id = info.get('paramId', '')
-            label = info.get('label', '')
-
-            if param_id:
-                lines.append(f'setupKnob({member_name}, {param_id}, "{label}");')
-
-        lines.append("")
-        lines.append("// Add components to visible")
-
-        # Add all components to visible
+    def generate_resized_snippet(self) -> str:
+        """Generate resized() method layout code"""
+        return self.generate_snippets()[2]
+
+    def generate_snippets(self) -> Tuple[str, str, str]:
+        """Generate (header, constructor, resized) snippets in one emit pass"""
+        buffers = (io.StringIO(), io.StringIO(), io.StringIO())
+        self.emit_all(*buffers)
+        return tuple(buf.getvalue() for buf in buffers)
+
+    def emit_all(self, header_fh: TextIO, constructor_fh: TextIO, resized_fh: TextIO):
+        """Write header, constructor and resized() snippets, streaming to the given files"""
+        header_fh.write("// AUTO-GENERATED from SR.svg - Review before integrating\n"
+                        "// Member variable declarations\n"
+                        "\n")
+        constructor_fh.write("// AUTO-GENERATED from SR.svg - Review before integrating\n"
+                             "// Constructor initialization\n"
+                             "\n"
+                             "// Setup knobs with parameter attachments\n")
+        resized_fh.write("// AUTO-GENERATED from SR.svg - Review before integrating\n"
+                         "// resized() method layout\n"
+                         "\n"
+                         "const float scaleX = getWidth() / 850.0f;\n"
+                         "const float scaleY = getHeight() / 720.0f;\n"
+                         "const int knobWidth = static_cast<int>(85 * scaleX);\n"
+                         "const int knobHeight = static_cast<int>(100 * scaleY);\n"
+                         "\n")
+
+        # Constructor, in SVG order: setupKnob calls stream out directly while
+        # addAndMakeVisible calls are held for the block that follows them
+        visible = []
         for comp in self.components:
-            info = self.mapper.get_component_info(comp.id)
+            info = self._info[comp.id]
             if not info:
                 continue
 
             member_name = info.get('member', '')
             comp_type = info.get('type', '')
 
-            # Skip modulation buttons and indicators
-            if comp_type in ['ModButton', 'Indicator', 'Unknown']:
-                continue
-
-            if comp_type in ['OccultKnob', 'TextButton', 'ComboBox',
-                           'WaveformDisplay', 'GrainVisualizer', 'LFOVisualizer']:
-                lines.append(f'addAndMakeVisible({member_name});')
-
-        return '\n'.join(lines)
-
-    def generate_resized_snippet(self) -> str:
-        """Generate resized() method layout code"""
-        lines = [
-            "// AUTO-GENERATED from SR.svg - Review before integrating",
-            "// resized() method layout",
-            "",
-            "const float scaleX = getWidth() / 850.0f;",
-            "const float scaleY = getHeight() / 720.0f;",
-            "const int knobWidth = static_cast<int>(85 * scaleX);",
-            "const int knobHeight = static_cast<int>(100 * scaleY);",
-            ""
-        ]
-
-        # Group components by section
-        sections = {}
-        for comp in self.components:
-            section = comp.section or "Other"
-            if section not in sections:
-                sections[section] = []
-            sections[section].append(comp)
-
-        # Generate setBounds calls by section
-        for section, comps in sorted(sections.items()):
+            if comp_type == 'OccultKnob':
+                param_id = info.get('paramId', '')
+                if param_id:
+                    label = info.get('label', '')
+                    constructor_fh.write(f'setupKnob({member_name}, {param_id}, "{label}");\n')
+
+            # Same emitted types as the header; modulation buttons and indicators are skipped
+            if comp_type in _HEADER_EMITTERS:
+                visible.append(f'addAndMakeVisible({member_name});\n')
+
+        constructor_fh.write("\n"
+                             "// Add components to visible\n")
+        constructor_fh.writelines(visible)
+
+        # Header declarations and setBounds calls share the section traversal
+        separator = ""
+        for section, comps in self._sorted_sections:
             if section in ['Panel', 'Decorations', 'Header']:
                 continue  # Skip non-control sections
 
-            lines.append(f"// {section}")
+            # Blank line between sections
+            header_fh.write(f"{separator}// {section}\n")
+            resized_fh.write(f"{separator}// {section}\n")
+            separator = "\n"
 
-            for comp in comps:
-                info = self.mapper.get_component_info(comp.id)
+            for comp, (x_px, y_px, w_px, h_px) in comps:
+                info = self._info[comp.id]
                 if not info:
+                    header_fh.write(f"// UNMAPPED: {comp.id}\n")
                     continue
 
-                member_name = info.get('member', '')
                 comp_type = info.get('type', '')
 
+                # Modulation buttons and indicators have no emitter (handled separately)
+                emit = _HEADER_EMITTERS.get(comp_type)
+                if emit:
+                    header_fh.write(emit(info.get('member', comp.id), info.get('label', '')))
+
                 # Skip modulation buttons and indicators
-                if comp_type in ['ModButton', 'Indicator', 'Unknown']:
+                if comp_type in _SKIP_TYPES:
                     continue
 
-                # Convert coordinates
+                member_name = info.get('member', '')
                 if comp.type == 'circle':
-                    # For circles, center position needs adjustment
-                    x_px, y_px = self.converter.to_juce(comp.x, comp.y)
-                    # Adjust for knob size (center to top-left)
-                    lines.append(f"{member_name}.setBounds(")
-                    lines.append(f"    static_cast<int>({x_px} * scaleX) - knobWidth/2,  // SVG: {comp.x:.1f}mm")
-                    lines.append(f"    static_cast<int>({y_px} * scaleY) - knobHeight/2, // SVG: {comp.y:.1f}mm")
-                    lines.append(f"    knobWidth,")
-                    lines.append(f"    knobHeight")
-                    lines.append(");")
+                    resized_fh.write(_CIRCLE_TMPL.format(
+                        m=member_name, x=x_px, y=y_px, xmm=comp.x, ymm=comp.y))
                 else:
                     # For rectangles, use top-left corner
-                    x_px, y_px = self.converter.to_juce(comp.x, comp.y)
-                    w_px, h_px = self.converter.size_to_juce(comp.width, comp.height)
-                    lines.append(f"{member_name}.setBounds(")
-                    lines.append(f"    static_cast<int>({x_px} * scaleX),  // SVG: {comp.x:.1f}mm")
-                    lines.append(f"    static_cast<int>({y_px} * scaleY),  // SVG: {comp.y:.1f}mm")
-                    lines.append(f"    static_cast<int>({w_px} * scaleX),")
-                    lines.append(f"    static_cast<int>({h_px} * scaleY)")
-                    lines.append(");")
-
-            lines.append("")
-
-        return '\n'.join(lines)
+                    resized_fh.write(_RECT_TMPL.format(
+                        m=member_name, x=x_px, y=y_px, xmm=comp.x, ymm=comp.y, w=w_px, h=h_px))
 
 
 class SVGToJUCEConverter:
@@ -465,38 +558,11 @@ class SVGToJUCEConverter:
 
     def _suggest_param_id(self, svg_id: str) -> str:
         """Suggest a ParamID based on SVG ID"""
-        # Map common SVG IDs to parameter IDs
-        param_map = {
-            'knob_position': 'ParamIDs::position',
-            'knob_size': 'ParamIDs::grainSize',
-            'knob_density': 'ParamIDs::density',
-            'knob_pitch': 'ParamIDs::pitch',
-            'knob_spray': 'ParamIDs::spray',
-            'knob_pan': 'ParamIDs::panSpread',
-            'knob_gatk': 'ParamIDs::grainAttack',
-            'knob_grel': 'ParamIDs::grainRelease',
-            'knob_attack': 'ParamIDs::voiceAttack',
-            'knob_decay': 'ParamIDs::voiceDecay',
-            'knob_sustain': 'ParamIDs::voiceSustain',
-            'knob_release': 'ParamIDs::voiceRelease',
-            'knob_lfo_rate': 'ParamIDs::lfoRate',
-            'knob_lfo_amount': 'ParamIDs::lfoAmount',
-            'lfo_waveform_box': 'ParamIDs::lfoWaveform',
-            'knob_delay': 'ParamIDs::delayTime',
-            'knob_flutter': 'ParamIDs::flutter',
-            'knob_hiss': 'ParamIDs::tapeHiss',
-            'knob_damage': 'ParamIDs::damage',
-            'knob_life': 'ParamIDs::life',
-            'knob_reverb': 'ParamIDs::reverb',
-            'knob_feedback': 'ParamIDs::feedback',
-            'knob_mix': 'ParamIDs::mix',
-            'knob_output': 'ParamIDs::output',
-            'sample_gain_knob': 'ParamIDs::sampleGain',
-        }
-
-        return param_map.get(svg_id, '')
+        return _PARAM_MAP.get(svg_id, '')
 
-    def _suggest_label(self, svg_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _suggest_label(svg_id: str) -> str:
         """Suggest a UI label based on SVG ID"""
         # Remove prefixes
         label = svg_id.replace('knob_', '').replace('mod_', '').replace('_btn', '')
@@ -534,11 +600,15 @@ class SVGToJUCEConverter:
         components = self.parser.parse()
         print(f"Found {len(components)} components\n")
 
-        # Check for unmapped components
+        # Check for unmapped components; note placed ones for the geometry checks
         unmapped = []
-        for comp in components:
+        placed = []
+        for index, comp in enumerate(components):
+            info = self.mapper.get_component_info(comp.id)
             if comp.id not in self.mapper.mapping:
                 unmapped.append(comp.id)
+            elif info and info.get('type') not in _SKIP_TYPES:
+                placed.append(index)
 
         if unmapped:
             print(f"WARNING: {len(unmapped)} unmapped SVG components:")
@@ -558,25 +628,11 @@ class SVGToJUCEConverter:
                 print(f"  - {comp_id}")
             print()
 
-        # Check for position overlaps (within 10px)
-        overlaps = []
-        for i, comp1 in enumerate(components):
-            info1 = self.mapper.get_component_info(comp1.id)
-            if not info1 or info1.get('type') in ['ModButton', 'Indicator', 'Unknown']:
-                continue
-
-            for comp2 in components[i+1:]:
-                info2 = self.mapper.get_component_info(comp2.id)
-                if not info2 or info2.get('type') in ['ModButton', 'Indicator', 'Unknown']:
-                    continue
-
-                # Calculate distance
-                dx = abs(comp1.x - comp2.x)
-                dy = abs(comp1.y - comp2.y)
-                distance = (dx**2 + dy**2)**0.5
-
-                if distance < 2:  # Less than 2mm apart
-                    overlaps.append((comp1.id, comp2.id, distance))
+        # Check for position overlaps (within 10px) and components outside
+        # SVG bounds in one geometry pass
+        svg_width = 225  # mm
+        svg_height = 190  # mm
+        overlaps, out_of_bounds = self._check_geometry(components, placed, svg_width, svg_height)
 
         if overlaps:
             print(f"WARNING: {len(overlaps)} potential component overlaps:")
@@ -584,15 +640,6 @@ class SVGToJUCEConverter:
                 print(f"  - {comp1_id} & {comp2_id} ({dist:.1f}mm apart)")
             print()
 
-        # Check for components outside SVG bounds
-        out_of_bounds = []
-        svg_width = 225  # mm
-        svg_height = 190  # mm
-
-        for comp in components:
-            if comp.x < 0 or comp.x > svg_width or comp.y < 0 or comp.y > svg_height:
-                out_of_bounds.append(comp.id)
-
         if out_of_bounds:
             print(f"WARNING: {len(out_of_bounds)} components outside SVG bounds:")
             for comp_id in out_of_bounds:
@@ -605,6 +652,48 @@ class SVGToJUCEConverter:
         else:
             print(f"Validation complete with {len(unmapped) + len(unknown_type) + len(overlaps) + len(out_of_bounds)} warnings.")
 
+    def _check_geometry(self, components: List[SVGComponent], placed: List[int],
+                        svg_width: float, svg_height: float
+                        ) -> Tuple[List[Tuple[str, str, float]], List[str]]:
+        """Find placed components less than 2mm apart and components outside SVG bounds"""
+        if HAS_NUMPY:
+            # One coordinate array pair shared by the bounds and overlap checks
+            count = len(components)
+            xs = np.fromiter((c.x for c in components), dtype=np.float64, count=count)
+            ys = np.fromiter((c.y for c in components), dtype=np.float64, count=count)
+
+            outside = np.nonzero((xs < 0) | (xs > svg_width) | (ys < 0) | (ys > svg_height))[0]
+            out_of_bounds = [components[i].id for i in outside.tolist()]
+
+            # Pairwise squared distances in one broadcast, upper triangle only
+            index = np.array(placed, dtype=np.intp)
+            px, py = xs[index], ys[index]
+            dx = px[:, None] - px[None, :]
+            dy = py[:, None] - py[None, :]
+            d2 = dx * dx + dy * dy
+            rows, cols = np.nonzero(np.triu(d2 < 4.0, k=1))  # Less than 2mm apart
+            overlaps = [(components[placed[i]].id, components[placed[j]].id, float(np.sqrt(d2[i, j])))
+                        for i, j in zip(rows.tolist(), cols.tolist())]
+            return overlaps, out_of_bounds
+
+        out_of_bounds = [comp.id for comp in components
+                         if comp.x < 0 or comp.x > svg_width or comp.y < 0 or comp.y > svg_height]
+
+        overlaps = []
+        eligible = [components[i] for i in placed]
+        for i, comp1 in enumerate(eligible):
+            x1, y1 = comp1.x, comp1.y
+            for comp2 in eligible[i+1:]:
+                # Compare squared distance; sqrt only for reported pairs
+                dx = x1 - comp2.x
+                dy = y1 - comp2.y
+                d2 = dx*dx + dy*dy
+
+                if d2 < 4.0:  # Less than 2mm apart
+                    overlaps.append((comp1.id, comp2.id, d2**0.5))
+
+        return overlaps, out_of_bounds
+
     def generate_code(self, dry_run=False):
         """Generate JUCE C++ code snippets"""
         # Load mapping
@@ -625,11 +714,9 @@ class SVGToJUCEConverter:
         # Generate snippets
         print("Generating code snippets...")
 
-        header_snippet = generator.generate_header_snippet()
-        constructor_snippet = generator.generate_constructor_snippet()
-        resized_snippet = generator.generate_resized_snippet()
-
         if dry_run:
+            header_snippet, constructor_snippet, resized_snippet = generator.generate_snippets()
+
             print("\n" + "="*60)
             print("DRY RUN - Generated code preview:")
             print("="*60)
@@ -649,21 +736,18 @@ class SVGToJUCEConverter:
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
 
-        # Write to files
+        # Stream all snippets straight to files in one pass
         header_file = os.path.join(self.output_dir, 'header_snippet.hpp')
         constructor_file = os.path.join(self.output_dir, 'constructor_snippet.cpp')
         resized_file = os.path.join(self.output_dir, 'resized_snippet.cpp')
 
-        with open(header_file, 'w') as f:
-            f.write(header_snippet)
-        print(f"Generated: {header_file}")
+        with open(header_file, 'w') as header_fh, \
+                open(constructor_file, 'w') as constructor_fh, \
+                open(resized_file, 'w') as resized_fh:
+            generator.emit_all(header_fh, constructor_fh, resized_fh)
 
-        with open(constructor_file, 'w') as f:
-            f.write(constructor_snippet)
+        print(f"Generated: {header_file}")
         print(f"Generated: {constructor_file}")
-
-        with open(resized_file, 'w') as f:
-            f.write(resized_snippet)
         print(f"Generated: {resized_file}")
 
         print("\nCode generation complete!")